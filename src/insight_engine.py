@@ -0,0 +1,605 @@
+import asyncio
+import pandas as pd
+import numpy as np
+import openai
+import os
+from numba import njit
+from typing import Dict, List, Tuple, Optional
+
+
+@njit(cache=True)
+def _slopes_kernel(aqi, rain):
+    """
+    Fused closed-form OLS slopes for one area's AQI and rainfall series
+
+    A single pass accumulates the sums both trend slopes need (against the
+    shared x = 0..n-1 axis), so there is one compiled call per area instead
+    of a chain of small NumPy reductions. The slopes only feed threshold
+    comparisons, so sequential accumulation is safe here; the averages and
+    scores stay on the NumPy path to keep their rounding bit-identical.
+
+    Returns:
+        (aqi_slope, rainfall_slope)
+    """
+    n = aqi.shape[0]
+    if n < 2:
+        return 0.0, 0.0
+
+    sum_aqi = 0.0
+    sum_rain = 0.0
+    for i in range(n):
+        sum_aqi += aqi[i]
+        sum_rain += rain[i]
+    avg_aqi = sum_aqi / n
+    avg_rain = sum_rain / n
+
+    x_mean = (n - 1) / 2.0
+    x_var = 0.0
+    sxy_aqi = 0.0
+    sxy_rain = 0.0
+    for i in range(n):
+        x_centered = i - x_mean
+        x_var += x_centered * x_centered
+        sxy_aqi += x_centered * (aqi[i] - avg_aqi)
+        sxy_rain += x_centered * (rain[i] - avg_rain)
+
+    return sxy_aqi / x_var, sxy_rain / x_var
+
+class ClimateInsightEngine:
+    # Parquet cache of the cleaned frames, keyed by source file: loading
+    # typed Parquet skips CSV parsing and suffix cleanup on warm starts
+    _CACHE_DIR = '.cache'
+    _CACHE_SOURCES = {
+        'aqi_rainfall.parquet': 'input-data/AQI-Rainfall.csv',
+        'soil_elevation.parquet': 'input-data/Soil_type-Elevation.csv',
+        'predictions.parquet': 'output-data/aqi_rainfall_predictions_2025_2030.csv'
+    }
+
+    # Soil types treated as clayey for the lake bed probability; the soil
+    # types are a closed set, so exact membership beats substring search
+    _CLAYEY_TYPES = frozenset({'Clayey Soil'})
+
+    def __init__(self, openai_api_key: str):
+        """
+        Initialize the Climate Insight Engine
+        
+        Args:
+            openai_api_key: OpenAI API key for intelligent analysis
+        """
+        # Fail at construction time rather than inside the first API call,
+        # after data loading and analysis have already run
+        if not openai_api_key or not isinstance(openai_api_key, str):
+            raise ValueError("An OpenAI API key is required - set the OPENAI_API_KEY environment variable")
+
+        openai.api_key = openai_api_key
+        self.client = openai.OpenAI(api_key=openai_api_key)
+        self.async_client = openai.AsyncOpenAI(api_key=openai_api_key)
+        
+        # Load data files
+        self.aqi_rainfall_data = None
+        self.soil_elevation_data = None
+        self.predictions_data = None
+        
+        # Soil type water absorption mapping (lower score = less absorption = higher waterlogging risk)
+        self.soil_absorption_map = {
+            'Clayey Soil': 2,  # Poor drainage, high waterlogging risk
+            'Red Loamy Soil': 7,  # Good drainage
+            'Laterite Soil': 5,  # Moderate drainage
+            'Sandy Soil': 9,  # Excellent drainage
+            'Black Cotton Soil': 1,  # Very poor drainage, high expansion-contraction
+            'Alluvial Soil': 6  # Good drainage
+        }
+
+        # Cache of AI insights keyed by the prompt inputs, so repeated
+        # requests for the same area skip the OpenAI round trip entirely
+        self._ai_insights_cache = {}
+
+        self.load_data()
+    
+    def load_data(self):
+        """Load all required data files, preferring the Parquet cache"""
+        try:
+            if self._parquet_cache_is_fresh():
+                # Cleaned frames were cached by a previous run - skip CSV
+                # parsing and cleanup entirely
+                self._load_parquet_cache()
+            else:
+                # Load historical AQI and rainfall data
+                self.aqi_rainfall_data = pd.read_csv('input-data/AQI-Rainfall.csv', engine='pyarrow')
+
+                # Load soil and elevation data
+                self.soil_elevation_data = pd.read_csv('input-data/Soil_type-Elevation.csv', engine='pyarrow')
+
+                # Load predictions data
+                self.predictions_data = pd.read_csv('output-data/aqi_rainfall_predictions_2025_2030.csv', engine='pyarrow')
+
+                # Clean the data
+                self._clean_data()
+
+                self._write_parquet_cache()
+
+            # Cache the deterministic per-area analyses once, so queries from
+            # the UI are dictionary lookups instead of DataFrame scans
+            self._precompute_area_analyses()
+
+            # Sorted area list for UI dropdowns, so callers don't re-read
+            # the CSV just to enumerate areas
+            self.areas = sorted(self.aqi_rainfall_data['Area'].unique().tolist())
+
+            print("✅ Data loaded successfully!")
+
+        except Exception as e:
+            # Propagate so construction fails outright: a half-initialized
+            # engine (no frames, no caches, no areas) is unusable, and the
+            # Streamlit factory would otherwise pin it process-wide
+            print(f"❌ Error loading data: {e}")
+            raise
+
+    def _parquet_cache_is_fresh(self):
+        """Check that every cache file exists and is newer than its source"""
+        for cache_name, source in self._CACHE_SOURCES.items():
+            cache_path = os.path.join(self._CACHE_DIR, cache_name)
+            if not os.path.exists(cache_path):
+                return False
+            if os.path.getmtime(cache_path) < os.path.getmtime(source):
+                return False
+        return True
+
+    def _load_parquet_cache(self):
+        """Load the cleaned frames from the Parquet cache"""
+        self.aqi_rainfall_data = pd.read_parquet(os.path.join(self._CACHE_DIR, 'aqi_rainfall.parquet'))
+        self.soil_elevation_data = pd.read_parquet(os.path.join(self._CACHE_DIR, 'soil_elevation.parquet'))
+        self.predictions_data = pd.read_parquet(os.path.join(self._CACHE_DIR, 'predictions.parquet'))
+
+    def _write_parquet_cache(self):
+        """Persist the cleaned frames so later runs skip CSV parsing"""
+        os.makedirs(self._CACHE_DIR, exist_ok=True)
+        self.aqi_rainfall_data.to_parquet(os.path.join(self._CACHE_DIR, 'aqi_rainfall.parquet'))
+        self.soil_elevation_data.to_parquet(os.path.join(self._CACHE_DIR, 'soil_elevation.parquet'))
+        self.predictions_data.to_parquet(os.path.join(self._CACHE_DIR, 'predictions.parquet'))
+    
+    def _clean_data(self):
+        """Clean and preprocess the data"""
+        # Clean AQI rainfall data - remove 'mm' and 'meters' suffixes
+        # (removesuffix avoids the regex path that str.replace would take)
+        if 'Rainfall (mm)' in self.aqi_rainfall_data.columns:
+            self.aqi_rainfall_data['Rainfall'] = self.aqi_rainfall_data['Rainfall (mm)'].str.removesuffix(' mm').astype(float)
+
+        # Clean soil elevation data
+        if 'Elevation (m)' in self.soil_elevation_data.columns:
+            self.soil_elevation_data['Elevation'] = self.soil_elevation_data['Elevation (m)'].str.removesuffix(' meters').astype(float)
+    
+    def _precompute_area_analyses(self):
+        """Build per-area analysis caches with a single groupby pass each"""
+        # One groupby over the full frame, with each group's columns
+        # converted to plain NumPy arrays up front - per-area work then
+        # never touches pandas again
+        self._by_area = {
+            area: {
+                'aqi': group['AQI'].to_numpy(np.float64),
+                'rain': group['Rainfall'].to_numpy(np.float64),
+                'years': group['Year'].to_numpy()
+            }
+            for area, group in self.aqi_rainfall_data.groupby('Area', sort=False)
+        }
+        self._area_historical = {
+            area: self._compute_historical_trends(arrays)
+            for area, arrays in self._by_area.items()
+        }
+        self._area_soil = self._compute_soil_features()
+
+    def analyze_historical_trends(self, area: str) -> Dict:
+        """
+        Analyze historical AQI and rainfall trends for an area
+
+        Args:
+            area: Name of the area to analyze
+
+        Returns:
+            Dictionary containing trend analysis
+        """
+        return self._area_historical.get(area, {
+            'aqi_trend': 'No data available',
+            'rainfall_trend': 'No data available',
+            'aqi_score': 5,  # Neutral score
+            'rainfall_score': 5,
+            'data_years': []
+        })
+
+    def _compute_historical_trends(self, arrays: Dict) -> Dict:
+        """Compute the trend analysis dictionary for one area's arrays"""
+        aqi_values = arrays['aqi']
+        rainfall_values = arrays['rain']
+        years = arrays['years']
+
+        # Both trend slopes come out of one fused compiled pass
+        aqi_slope, rainfall_slope = _slopes_kernel(aqi_values, rainfall_values)
+
+        # Calculate trend direction
+        aqi_trend = 'stable'
+        rainfall_trend = 'stable'
+
+        if aqi_slope > 2:
+            aqi_trend = 'worsening'
+        elif aqi_slope < -2:
+            aqi_trend = 'improving'
+
+        if rainfall_slope > 10:
+            rainfall_trend = 'increasing'
+        elif rainfall_slope < -10:
+            rainfall_trend = 'decreasing'
+
+        # Calculate scores (1-10 scale)
+        avg_aqi = np.mean(aqi_values)
+        avg_rainfall = np.mean(rainfall_values)
+
+        # AQI Score (lower AQI is better, so invert the score)
+        aqi_score = max(1, min(10, 10 - (avg_aqi / 50) * 9))
+
+        # Rainfall Score (moderate rainfall is best, too much or too little is bad)
+        optimal_rainfall = 1200  # mm per year
+        rainfall_deviation = abs(avg_rainfall - optimal_rainfall) / optimal_rainfall
+        rainfall_score = max(1, min(10, 10 - rainfall_deviation * 9))
+
+        return {
+            'aqi_trend': aqi_trend,
+            'rainfall_trend': rainfall_trend,
+            'aqi_score': round(aqi_score, 1),
+            'rainfall_score': round(rainfall_score, 1),
+            'avg_aqi': round(avg_aqi, 1),
+            'avg_rainfall': round(avg_rainfall, 1),
+            'data_years': list(years)
+        }
+    
+    def analyze_soil_characteristics(self, area: str) -> Dict:
+        """
+        Analyze soil type and elevation to determine lake bed probability and water absorption
+
+        Args:
+            area: Name of the area to analyze
+
+        Returns:
+            Dictionary containing soil analysis
+        """
+        return self._area_soil.get(area, {
+            'soil_type': 'Unknown',
+            'elevation': 0,
+            'lake_bed_probability': 5,
+            'water_absorption_score': 5,
+            'waterlogging_risk': 5
+        })
+
+    def _compute_soil_features(self) -> Dict:
+        """Compute the soil analysis for every area with vectorized column math"""
+        # Take the first match per area, as the per-call version did
+        sd = self.soil_elevation_data.drop_duplicates('Area').copy()
+
+        # Calculate lake bed probability based on elevation and soil type
+        # Lower elevation + clayey soil = higher lake bed probability
+        elevation_factor = ((1000 - sd['Elevation']) / 1000).clip(lower=0)
+        soil_factor = np.where(sd['Soil Type'].isin(self._CLAYEY_TYPES), 0.8, 0.3)
+        sd['lake_bed_probability'] = ((elevation_factor + soil_factor) * 10).clip(1, 10).round(1)
+
+        # Get water absorption score from soil type
+        sd['water_absorption_score'] = sd['Soil Type'].map(self.soil_absorption_map).fillna(5).astype(int)
+
+        # Calculate waterlogging risk (inverse of absorption + elevation factor)
+        sd['waterlogging_risk'] = (11 - sd['water_absorption_score'] + elevation_factor * 3).clip(1, 10).round(1)
+
+        sd = sd.rename(columns={'Soil Type': 'soil_type', 'Elevation': 'elevation'})
+        columns = ['soil_type', 'elevation', 'lake_bed_probability',
+                   'water_absorption_score', 'waterlogging_risk']
+        return sd.set_index('Area')[columns].to_dict('index')
+    
+    def calculate_risk_scores(self, historical_analysis: Dict, soil_analysis: Dict) -> Dict:
+        """
+        Calculate climate risk scores for different factors
+        
+        Args:
+            historical_analysis: Historical trend analysis results
+            soil_analysis: Soil characteristics analysis results
+            
+        Returns:
+            Dictionary containing risk scores
+        """
+        # Air Quality Score (based on AQI trends)
+        air_quality_score = historical_analysis['aqi_score']
+        
+        # Construction Stability Score (based on soil absorption and waterlogging risk)
+        # Lower waterlogging risk = higher construction stability
+        construction_stability = max(1, min(10, 11 - soil_analysis['waterlogging_risk']))
+        
+        # Water Management Score (based on rainfall trends and absorption)
+        water_mgmt_base = (historical_analysis['rainfall_score'] + soil_analysis['water_absorption_score']) / 2
+        water_management_score = min(10, max(1, water_mgmt_base))
+        
+        # Overall Climate Risk Score (inverted - lower is better for risk)
+        overall_score = (air_quality_score + construction_stability + water_management_score) / 3
+        climate_risk_score = max(1, min(10, 11 - overall_score))  # Invert so higher = more risk
+        
+        return {
+            'air_quality': round(air_quality_score, 1),
+            'construction_stability': round(construction_stability, 1),
+            'water_management': round(water_management_score, 1),
+            'climate_risk_score': round(climate_risk_score, 1)
+        }
+    
+    # System message shared by the sync, async and streaming insight calls
+    _AI_SYSTEM_MESSAGE = "You are a climate risk analyst providing brief, provided the given information generate insights for potential real estate buyers in the area. consider things like based on soil type there can be less or more water logging. more water logging means less structure strength over time etc. Explain how the AQI will affect health etc. Analyze everything thoroughly and give concise answers."
+
+    def _insight_cache_key(self, area: str, analysis_data: Dict) -> Tuple:
+        """Build the cache key from everything the prompt depends on"""
+        scores = analysis_data['risk_scores']
+        soil = analysis_data['soil_analysis']
+        hist = analysis_data['historical_analysis']
+
+        # Scores are already rounded to one decimal, so identical analyses
+        # hash to the same key
+        return (
+            area,
+            scores['climate_risk_score'],
+            scores['air_quality'],
+            scores['construction_stability'],
+            scores['water_management'],
+            soil['soil_type'],
+            soil['waterlogging_risk'],
+            hist['aqi_trend'],
+            hist['rainfall_trend']
+        )
+
+    def _build_insight_prompt(self, area: str, analysis_data: Dict) -> str:
+        """Build the user prompt for the AI insight request"""
+        return f"""
+            Analyze the climate risk data for {area} and provide a brief, actionable insight (2-3 sentences max):
+
+            Climate Risk Score: {analysis_data['risk_scores']['climate_risk_score']}/10
+            Air Quality Score: {analysis_data['risk_scores']['air_quality']}/10
+            Construction Stability: {analysis_data['risk_scores']['construction_stability']}/10
+            Water Management: {analysis_data['risk_scores']['water_management']}/10
+
+            Soil Type: {analysis_data['soil_analysis']['soil_type']}
+            Waterlogging Risk: {analysis_data['soil_analysis']['waterlogging_risk']}/10
+            AQI Trend: {analysis_data['historical_analysis']['aqi_trend']}
+            Rainfall Trend: {analysis_data['historical_analysis']['rainfall_trend']}
+
+            Focus on the biggest risks and actionable recommendations.
+            """
+
+    def _insight_request_params(self, area: str, analysis_data: Dict) -> Dict:
+        """Build the chat-completion request shared by all insight calls"""
+        return {
+            'model': 'gpt-3.5-turbo',
+            'messages': [
+                {"role": "system", "content": self._AI_SYSTEM_MESSAGE},
+                {"role": "user", "content": self._build_insight_prompt(area, analysis_data)}
+            ],
+            'max_tokens': 150,
+            'temperature': 0.7
+        }
+
+    def get_ai_insights(self, area: str, analysis_data: Dict) -> str:
+        """
+        Use OpenAI to generate intelligent insights about the area
+
+        Args:
+            area: Area name
+            analysis_data: Complete analysis data
+
+        Returns:
+            AI-generated insights string
+        """
+        cache_key = self._insight_cache_key(area, analysis_data)
+        cached = self._ai_insights_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = self.client.chat.completions.create(
+                **self._insight_request_params(area, analysis_data)
+            )
+
+            insight = response.choices[0].message.content.strip()
+            self._ai_insights_cache[cache_key] = insight
+            return insight
+
+        except Exception as e:
+            # Don't cache failures - the next call should retry the API
+            return f"AI analysis unavailable: {str(e)}"
+
+    async def get_ai_insights_async(self, area: str, analysis_data: Dict) -> str:
+        """
+        Async variant of get_ai_insights, used for concurrent batch analysis
+
+        Args:
+            area: Area name
+            analysis_data: Complete analysis data
+
+        Returns:
+            AI-generated insights string
+        """
+        cache_key = self._insight_cache_key(area, analysis_data)
+        cached = self._ai_insights_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._insight_request_params(area, analysis_data)
+            )
+
+            insight = response.choices[0].message.content.strip()
+            self._ai_insights_cache[cache_key] = insight
+            return insight
+
+        except Exception as e:
+            return f"AI analysis unavailable: {str(e)}"
+
+    async def get_ai_insights_batch(self, items: List[Tuple[str, Dict]]) -> List[str]:
+        """
+        Fetch AI insights for several areas concurrently
+
+        Args:
+            items: List of (area, analysis_data) pairs
+
+        Returns:
+            List of insight strings in the same order as the input
+        """
+        return list(await asyncio.gather(
+            *[self.get_ai_insights_async(area, data) for area, data in items]
+        ))
+
+    def stream_ai_insights(self, area: str, analysis_data: Dict):
+        """
+        Stream the AI insight as text chunks for incremental display
+
+        Args:
+            area: Area name
+            analysis_data: Complete analysis data
+
+        Yields:
+            Text chunks as they arrive from the API (or the cached insight
+            in a single chunk on a cache hit)
+        """
+        cache_key = self._insight_cache_key(area, analysis_data)
+        cached = self._ai_insights_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        try:
+            stream = self.client.chat.completions.create(
+                stream=True,
+                **self._insight_request_params(area, analysis_data)
+            )
+
+            chunks = []
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    chunks.append(chunk.choices[0].delta.content)
+                    yield chunks[-1]
+
+            insight = ''.join(chunks).strip()
+            if insight:
+                self._ai_insights_cache[cache_key] = insight
+
+        except Exception as e:
+            yield f"AI analysis unavailable: {str(e)}"
+    
+    def generate_insights(self, area: str, include_ai: bool = True) -> Dict:
+        """
+        Generate comprehensive climate insights for an area
+
+        Args:
+            area: Name of the area to analyze
+            include_ai: Whether to fetch AI insights synchronously; pass
+                False when the caller streams them separately
+
+        Returns:
+            Complete insights dictionary
+        """
+        print(f"\n🔍 Analyzing climate risks for: {area}")
+        print("=" * 50)
+        
+        # Perform all analyses
+        historical_analysis = self.analyze_historical_trends(area)
+        soil_analysis = self.analyze_soil_characteristics(area)
+        risk_scores = self.calculate_risk_scores(historical_analysis, soil_analysis)
+        
+        # Compile complete analysis
+        complete_analysis = {
+            'area': area,
+            'historical_analysis': historical_analysis,
+            'soil_analysis': soil_analysis,
+            'risk_scores': risk_scores
+        }
+        
+        # Get AI insights
+        if include_ai:
+            complete_analysis['ai_insights'] = self.get_ai_insights(area, complete_analysis)
+
+        return complete_analysis
+    
+    def display_insights(self, insights: Dict):
+        """
+        Display insights in a formatted way
+        
+        Args:
+            insights: Complete insights dictionary
+        """
+        area = insights['area']
+        hist = insights['historical_analysis']
+        soil = insights['soil_analysis']
+        scores = insights['risk_scores']
+        
+        print(f"\n📊 CLIMATE RISK ASSESSMENT FOR {area.upper()}")
+        print("=" * 60)
+        
+        print(f"\n🎯 CLIMATE RISK SCORE: {scores['climate_risk_score']}/10")
+        print("\n📈 RISK FACTORS:")
+        
+        # Create progress bars for visualization
+        def create_progress_bar(score, max_score=10, length=20):
+            filled = int((score / max_score) * length)
+            return "█" * filled + "░" * (length - filled)
+        
+        print(f"   🌬️  Air Quality:         {create_progress_bar(scores['air_quality'])} {scores['air_quality']}/10")
+        print(f"   🏗️  Construction Stability: {create_progress_bar(scores['construction_stability'])} {scores['construction_stability']}/10")
+        print(f"   💧 Water Management:     {create_progress_bar(scores['water_management'])} {scores['water_management']}/10")
+        
+        print(f"\n📋 DETAILED ANALYSIS:")
+        print(f"   • Soil Type: {soil['soil_type']}")
+        print(f"   • Elevation: {soil['elevation']}m")
+        print(f"   • Average AQI: {hist['avg_aqi']} ({hist['aqi_trend']} trend)")
+        print(f"   • Average Rainfall: {hist['avg_rainfall']}mm ({hist['rainfall_trend']} trend)")
+        print(f"   • Waterlogging Risk: {soil['waterlogging_risk']}/10")
+        print(f"   • Lake Bed Probability: {soil['lake_bed_probability']}/10")
+        
+        print(f"\n🤖 AI INSIGHTS:")
+        print(f"   {insights['ai_insights']}")
+        
+        print("\n" + "=" * 60)
+
+
+# Main testing block
+if __name__ == "__main__":
+    # Read the OpenAI API key from the environment - never hardcode keys
+    OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+    if not OPENAI_API_KEY:
+        raise SystemExit("❌ Set the OPENAI_API_KEY environment variable before running.")
+    # Initialize the insight engine
+    try:
+        engine = ClimateInsightEngine(OPENAI_API_KEY)
+        
+        # Test with different areas
+        test_areas = ['Koramangala', 'Hebbal', 'Malleswaram', 'Anekal']
+        
+        print("🌍 CLIMASHIELD - INSIGHT ENGINE")
+        print("====================================")
+        
+        # Interactive mode
+        while True:
+            print("\n" + "="*50)
+            print("Available test areas:", ", ".join(test_areas))
+            area_input = input("\nEnter area name (or 'quit' to exit): ").strip()
+            
+            if area_input.lower() == 'quit':
+                print("👋 Thank you for using ClimaShield!")
+                break
+            
+            if not area_input:
+                area_input = 'Koramangala'  # Default for testing
+                print(f"Using default area: {area_input}")
+            
+            # Generate and display insights
+            insights = engine.generate_insights(area_input)
+            engine.display_insights(insights)
+            
+            # Ask if user wants to continue
+            continue_choice = input("\nAnalyze another area? (y/n): ").strip().lower()
+            if continue_choice != 'y':
+                print("👋 Thank you for using ClimaShield!")
+                break
+                
+    except Exception as e:
+        print(f"❌ Error initializing engine: {e}")
+        print("Make sure your OpenAI API key is set correctly.")
@@ -12,14 +12,8 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 # Import the insight engine from src directory
-import importlib.util
-spec = importlib.util.spec_from_file_location("insight_engine", os.path.join(os.path.dirname(__file__), "src", "insight-engine.py"))
-insight_engine = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(insight_engine)
-
-ClimateInsightEngine = insight_engine.ClimateInsightEngine
-import plotly.graph_objects as go
-import plotly.express as px
+from insight_engine import ClimateInsightEngine
+import math
 
 # Page configuration
 st.set_page_config(
@@ -81,45 +75,35 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_engine(api_key):
+    """Build the insight engine once per worker process, shared by all sessions"""
+    return ClimateInsightEngine(api_key)
+
 @st.cache_data
-def load_available_areas():
-    """Load available areas from the dataset"""
-    try:
-        df = pd.read_csv('input-data/AQI-Rainfall.csv')
-        return sorted(df['Area'].unique().tolist())
-    except:
-        return ['Koramangala', 'Hebbal', 'Malleswaram', 'Anekal', 'Hunasamaranahalli']
+def svg_gauge(value, title):
+    """Create a lightweight inline-SVG gauge for risk scores (0-10)"""
+    fraction = max(0.0, min(1.0, value / 10))
+    angle = math.pi * (1 - fraction)
+    end_x = round(70 + 55 * math.cos(angle), 2)
+    end_y = round(75 - 55 * math.sin(angle), 2)
+    large_arc = 1 if fraction > 0.5 else 0
 
-def create_gauge_chart(value, title, color_scheme='RdYlGn_r'):
-    """Create a gauge chart for risk scores"""
-    fig = go.Figure(go.Indicator(
-        mode = "gauge+number",
-        value = value,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': title, 'font': {'size': 16}},
-        gauge = {
-            'axis': {'range': [None, 10], 'tickwidth': 1},
-            'bar': {'color': "darkblue"},
-            'steps': [
-                {'range': [0, 3], 'color': "lightgreen"},
-                {'range': [3, 6], 'color': "yellow"},
-                {'range': [6, 10], 'color': "lightcoral"}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': 8
-            }
-        }
-    ))
-    
-    fig.update_layout(
-        height=200,
-        margin=dict(l=20, r=20, t=40, b=20),
-        font={'color': "darkblue", 'family': "Arial"}
-    )
-    
-    return fig
+    if value <= 3:
+        color = "#27AE60"  # Green
+    elif value <= 6:
+        color = "#F39C12"  # Orange
+    else:
+        color = "#E74C3C"  # Red
+
+    return f"""
+    <svg width="220" height="150" viewBox="0 0 140 100" role="img" aria-label="{title}: {value}/10">
+        <path d="M 15 75 A 55 55 0 0 1 125 75" fill="none" stroke="#ECF0F1" stroke-width="12" stroke-linecap="round"/>
+        <path d="M 15 75 A 55 55 0 {large_arc} 1 {end_x} {end_y}" fill="none" stroke="{color}" stroke-width="12" stroke-linecap="round"/>
+        <text x="70" y="72" text-anchor="middle" font-size="26" font-weight="bold" fill="{color}">{value}</text>
+        <text x="70" y="92" text-anchor="middle" font-size="10" fill="#34495E">{title}</text>
+    </svg>
+    """
 
 def create_progress_bar(score, max_score=10):
     """Create a visual progress bar"""
@@ -152,18 +136,17 @@ def main():
     # Header
     st.markdown('<div class="main-header">🛡️ ClimaShield</div>', unsafe_allow_html=True)
     
-    # Initialize the engine
-    if 'engine' not in st.session_state:
-        try:
-            api_key = st.secrets["OPEN_API_KEY"]
-            st.session_state.engine = ClimateInsightEngine(api_key)
-            st.success("✅ ClimaShield Engine Loaded Successfully!")
-        except Exception as e:
-            st.error(f"❌ Error loading engine: {e}")
-            st.stop()
+    # Initialize the engine (cached across sessions, so new browser tabs
+    # reuse the loaded data instead of re-reading it)
+    try:
+        engine = get_engine(st.secrets["OPEN_API_KEY"])
+    except Exception as e:
+        st.error(f"❌ Error loading engine: {e}")
+        st.stop()
     
-    # Area selection
-    available_areas = load_available_areas()
+    # Area selection - the engine already holds the sorted area list, so no
+    # extra CSV read is needed here
+    available_areas = engine.areas
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
@@ -177,21 +160,26 @@ def main():
     
     if analyze_button and selected_area:
         with st.spinner('🔄 Analyzing climate data...'):
-            # Generate insights
-            insights = st.session_state.engine.generate_insights(selected_area)
-            
+            # Generate insights; the AI text is streamed below so tokens
+            # appear as they arrive instead of blocking on the full response
+            insights = engine.generate_insights(selected_area, include_ai=False)
+
             # Store insights in session state
             st.session_state.insights = insights
-    
+
     # Display results if available
     if 'insights' in st.session_state:
         # AI Insights
         insights = st.session_state.insights
         st.markdown("---")
         st.markdown("### 🤖 AI Insights & Recommendations")
-        
-        insight_text = insights.get('ai_insights', 'No AI insights available')
-        st.info(insight_text)
+
+        if 'ai_insights' in insights:
+            st.info(insights['ai_insights'])
+        else:
+            insights['ai_insights'] = st.write_stream(
+                engine.stream_ai_insights(insights['area'], insights)
+            )
 
         scores = insights['risk_scores']
         hist = insights['historical_analysis']
@@ -203,8 +191,11 @@ def main():
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             st.markdown('<div class="risk-label">Climate risk score</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="risk-score">{scores["climate_risk_score"]}</div>', unsafe_allow_html=True)
-            
+            st.markdown(
+                f'<div style="text-align: center;">{svg_gauge(scores["climate_risk_score"], "out of 10")}</div>',
+                unsafe_allow_html=True
+            )
+
             risk_status, status_class = get_risk_status(scores["climate_risk_score"])
             st.markdown(f'<div class="risk-label"><span class="{status_class}">{risk_status}</span></div>', unsafe_allow_html=True)
         
@@ -233,18 +224,16 @@ def main():
         with st.expander("🔮 Future Projections (2025-2030)"):
             st.info("📊 Future climate projections will be displayed here based on ML predictions")
             
-            # Create a simple projection chart
+            # Create a simple projection chart (st.line_chart renders with the
+            # built-in Vega-Lite bundle, no Plotly payload)
             years = [2025, 2026, 2027, 2028, 2029, 2030]
             projected_risk = [scores['climate_risk_score'] + np.random.normal(0, 0.5) for _ in years]
-            
-            fig = px.line(
-                x=years, 
-                y=projected_risk,
-                title="Projected Climate Risk Score Trend",
-                labels={'x': 'Year', 'y': 'Risk Score'}
+
+            projection = pd.DataFrame(
+                {'Risk Score': projected_risk},
+                index=pd.Index(years, name='Year')
             )
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
+            st.line_chart(projection, height=300)
         
         # Export functionality
         st.markdown("---")